@@ -1,6 +1,7 @@
+import hashlib
 import json
 
-from .util import All
+from .util import All, JSONStringEncoder
 
 
 class Entity(object):
@@ -8,30 +9,24 @@ class Entity(object):
     A hashable tree node that can have multiple parent links. Useful for tracing the lineage of a given entity backwards, but not forwards.
     """
 
+    __slots__ = ("image", "parents", "__hash")
+
     def __init__(self, image, parents):
         self.image = image
         self.parents = parents
-        self.__hash = hash(Entity.hash(image))
+        self.__hash = Entity.hash(image)
 
     @staticmethod
     def hash(val):
         """
-        Generate a hash of a nested structure of dicts and lists by tuplifying a deep as necessary to the nearest hashable type.
+        Generate a hash of a nested structure of dicts and lists by serializing to a canonical JSON bytestring and feeding that to BLAKE2. A single contiguous buffer hashed in C beats recursively tuplifying the structure at Python speed.
         """
-        try:
-            if isinstance(val, tuple):
-                return (hash(val), )
-            else:
-                return hash(val)
-        except TypeError:
-            if isinstance(val, dict):
-                return tuple(
-                    sorted((k, Entity.hash(v)) for k, v in val.items()))
-            elif isinstance(val, list):
-                # Normally we would sort this, but we can't always.
-                return tuple((Entity.hash(v) for v in val))
-            else:
-                raise TypeError("Unsupported type for hashing", type(val))
+        canonical = json.dumps(
+            val, sort_keys=True, separators=(",", ":"),
+            cls=JSONStringEncoder)
+        return int.from_bytes(
+            hashlib.blake2b(canonical.encode("utf-8"),
+                            digest_size=8).digest(), "little")
 
     def __hash__(self):
         return self.__hash
@@ -43,7 +38,9 @@ class Entity(object):
         return self.__str__()
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        # Short-circuit on the cached hash, but let the images themselves be
+        # authoritative so hash collisions can't merge distinct entities.
+        return hash(self) == hash(other) and self.image == other.image
 
 
 class Domain(object):
@@ -60,20 +57,46 @@ class Domain(object):
     def __init__(self, entity=None):
         self.root_entity = entity
         self.dimensions = dict()
-        self.entities = set()
+        # Fast path for dimension() lookups by raw (hashable) image, which
+        # skips Entity construction and its content hash entirely.
+        self.__dimensions_by_image = dict()
+        # Keyed by the entity itself; a dict gives the same dedup as a set
+        # but lets manifest() hand back the canonical interned instance.
+        self.entities = dict()
+        # Flat array of the entity images, maintained alongside the interning
+        # dict so images() is a straight copy instead of an attribute walk.
+        self.__images = list()
         self.facts = set()
+        self.__version = 0
 
     def dimension(self, entity):
         """
         Spawn a new Domain that exists at a specific entity in the current domain
         """
-        if not isinstance(entity, Entity):
-            entity = Entity(entity, None)
+        # Two distinct paths: Entities go straight to the dimensions dict,
+        # while plain images (shape names, mostly) try a cache keyed on the
+        # image itself before paying for Entity construction.
+        if isinstance(entity, Entity):
+            if entity not in self.dimensions:
+                self.dimensions[entity] = Domain(entity)
+            return self.dimensions[entity]
 
-        if entity not in self.dimensions:
-            self.dimensions[entity] = Domain(entity)
+        try:
+            dim = self.__dimensions_by_image.get(entity)
+            cacheable = True
+        except TypeError:
+            dim = None
+            cacheable = False
 
-        return self.dimensions[entity]
+        if dim is None:
+            ent = Entity(entity, None)
+            if ent not in self.dimensions:
+                self.dimensions[ent] = Domain(ent)
+            dim = self.dimensions[ent]
+            if cacheable:
+                self.__dimensions_by_image[entity] = dim
+
+        return dim
 
     def manifest(self, image, parents=None):
         """
@@ -84,11 +107,37 @@ class Domain(object):
         else:
             ent = image
 
-        self.entities.add(ent)
+        existing = self.entities.get(ent)
+        if existing is not None:
+            # Hand back the interned instance, but fold the new
+            # manifestation's parent links into it first — an equal image
+            # arriving via a different response is still part of that
+            # response's lineage. The parents lists are tiny, so a linear
+            # membership test beats growing them with duplicates.
+            if existing is not ent and ent.parents:
+                if existing.parents is None:
+                    existing.parents = list(ent.parents)
+                else:
+                    for parent in ent.parents:
+                        if parent not in existing.parents:
+                            existing.parents.append(parent)
+            return existing
+
+        self.entities[ent] = ent
+        self.__images.append(ent.image)
+        self.__version += 1
         return ent
 
+    def version(self):
+        """
+        A monotone counter that ticks whenever a new entity is manifested in this domain. Lets callers cheaply detect whether a dimension has grown since they last looked at it.
+        """
+        return self.__version
+
     def images(self):
-        return [ent.image for ent in self.entities]
+        # Copy so callers iterating candidates aren't affected by entities
+        # manifested mid-iteration.
+        return list(self.__images)
 
     def __str__(self):
         return str({
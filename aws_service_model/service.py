@@ -93,37 +93,66 @@ class AWSService(object):
 
         if service_name not in self.session.get_available_services():
             raise UnknownServiceException(service_name)
-        else:
-            self.client = self.session.client(service_name)
+
+        # Building a real client triggers endpoint resolution and the
+        # credential chain, which is wasted work when only the on-disk model
+        # is being inspected. Defer it until a method is actually called.
+        self.service_name = service_name
+        self.__client = None
+        self.__api_to_method = None
 
         service_dir = os.path.join(botocore_directory, "botocore", "data",
                                    service_name)
 
-        versions = sorted(os.listdir(service_dir))
+        # scandir caches the entry type from the directory read itself, so
+        # this avoids a stat() per child compared to listdir+isdir.
+        with os.scandir(service_dir) as entries:
+            versions = [
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
         if version is None:
-            version = versions[-1]
+            # Only the latest is wanted, so max() beats sorting the list.
+            version = max(versions)
         elif version not in version:
             raise ValueError("Provided version not in ")
 
         version_dir = os.path.join(service_dir, version)
-        with open(os.path.join(version_dir, "service-2.json"), "r") as fp:
-            service = json.loads(fp.read())
+        with open(os.path.join(version_dir, "service-2.json"), "rb") as fp:
+            service = json.load(fp)
 
+        # Not every service ships paginator definitions; anything else
+        # (bad JSON, permissions) should still surface.
         try:
             with open(os.path.join(version_dir, "paginators-1.json"),
-                      "r") as fp:
-                paginators = json.loads(fp.read())
-        except:
+                      "rb") as fp:
+                paginators = json.load(fp)
+        except FileNotFoundError:
             paginators = None
 
         self.service = service
         self.paginators = paginators
 
+        # Shapes are immutable once built, and the same shape names are
+        # referenced by many structures, so build each one exactly once.
+        self.shape_cache = dict()
+
+    @property
+    def client(self):
+        if self.__client is None:
+            self.__client = self.session.client(self.service_name)
+        return self.__client
+
     def get_method_name(self, operation_name):
-        for method, name in self.client.meta.method_to_api_mapping.items():
-            if name == operation_name:
-                return method
-        return None
+        if self.__api_to_method is None:
+            # Invert the method->API-name mapping once, so lookups are O(1)
+            # instead of a linear scan per operation call.
+            self.__api_to_method = {
+                name: method
+                for method, name in
+                self.client.meta.method_to_api_mapping.items()
+            }
+        return self.__api_to_method.get(operation_name)
 
     def get_method(self, operation_name):
         allowed_exceptions = [
@@ -159,8 +188,23 @@ class AWSService(object):
         return self.session.region_name
 
     def get_shape(self, shape_name):
-        raw_shape = self.raw_get_shape(shape_name)
-        return self.SHAPE_TYPE_MAP.get(raw_shape["type"])(shape_name, self)
+        shape = self.shape_cache.get(shape_name)
+        if shape is None:
+            raw_shape = self.raw_get_shape(shape_name)
+            cls = self.SHAPE_TYPE_MAP.get(raw_shape["type"])
+            # Register the instance before __init__ wires up member shapes:
+            # recursive models (structures or maps that reference themselves
+            # through their members) then resolve back to this instance
+            # instead of recursing until the stack runs out.
+            shape = cls.__new__(cls)
+            self.shape_cache[shape_name] = shape
+            try:
+                shape.__init__(shape_name, self)
+            except BaseException:
+                # Don't leave a half-built shape behind for later callers.
+                del self.shape_cache[shape_name]
+                raise
+        return shape
 
     def raw_get_shape(self, shape_name):
         shape = self.service["shapes"].get(shape_name)
@@ -1,3 +1,6 @@
+import re
+import sys
+
 from .exceptions import InsufficientMembersException
 
 # Used when populating a domain, some of the entities need to have their values massaged a bit.
@@ -6,12 +9,48 @@ from .special_cases import apply_entity_manifestation_transform as apply_emt
 from .special_cases import apply_image_construction_transform as apply_ict
 from .util import careful_dict_update, labeled_product
 
+# Bookkeeping for in-flight satisfies_leaf_condition traversals. The memo
+# itself lives on each Structure (keyed by the condition object, which
+# functions hash by identity), so entries die with the shape and no id()
+# recycling can cross-contaminate answers. These two module-level pieces
+# only track the current recursion: LEAF_CONDITION_STACK maps the id() of
+# each structure on the call stack to its frame index (safe, since the
+# shape is pinned by the stack while the entry exists), and
+# LEAF_CONDITION_TAINT holds one flag per frame marking results that were
+# computed against a provisional cycle answer and therefore must not be
+# cached.
+LEAF_CONDITION_STACK = dict()
+LEAF_CONDITION_TAINT = []
+
+# The models reuse a small alphabet of string patterns (ARNs, UUIDs, and so
+# on), so compile each distinct pattern once and share it across every String
+# shape that declares it. Patterns the Python regex engine rejects map to
+# None.
+STRING_PATTERN_CACHE = dict()
+
+
+def compile_string_pattern(pattern):
+    if pattern not in STRING_PATTERN_CACHE:
+        try:
+            STRING_PATTERN_CACHE[pattern] = re.compile(pattern)
+        except re.error:
+            STRING_PATTERN_CACHE[pattern] = None
+    return STRING_PATTERN_CACHE[pattern]
+
 
 class Shape(object):
+    __slots__ = ("service", "shape", "shape_name", "__str")
+
     def __init__(self, shape_name, service):
         self.service = service
         self.shape = service.raw_get_shape(shape_name)
         self.shape_name = shape_name
+        # str() of a shape is used in equality checks and logging on hot
+        # paths, so format it once up front. Interning makes the equality
+        # checks in __eq__ an identity comparison between shapes built for
+        # the same service/name pair.
+        self.__str = sys.intern("%s:%s" % (service.endpoint_prefix(),
+                                           shape_name))
 
     def name(self):
         return self.shape_name
@@ -44,49 +83,83 @@ class Shape(object):
         """
         # Create a dimension for this shape type, implicitly creating an Entity in the dimension() call.
         𝕊 = domain.dimension(self.name())
-        # Manifest this entity in the dimension for this shape.
+        # Manifest this entity in the dimension for this shape. No parent
+        # means no lineage, which manifest() spells None — don't allocate an
+        # empty list per rootless entity just to say so.
         ent = 𝕊.manifest(
-            image=image,
-            parents=[] if parent is None else [parent])
+            image=image, parents=None if parent is None else [parent])
         # Return the entity for this shape image for use as the parent for future images.
         return ent
 
     def __str__(self):
-        return "%s:%s" % (self.service_name(), self.name())
+        return self.__str
 
     def __repr__(self):
         return self.__str__()
 
     def __eq__(self, other):
-        return (self.name() == other.name()) and (
-            self.service_name() == other.service_name())
+        # The cached service:name string carries both halves of the old
+        # name()/service_name() comparison.
+        return str(self) == str(other)
 
 
 class Structure(Shape):
+    __slots__ = ("member_shapes", "__leaf_conditions")
+
     def __init__(self, shape_name, service):
         super().__init__(shape_name, service)
         self.member_shapes = {
             member_name: service.get_shape(member["shape"])
             for member_name, member in self.shape["members"].items()
         }
+        # Per-condition memo for satisfies_leaf_condition.
+        self.__leaf_conditions = dict()
 
     def members(self):
-        ret = dict()
-        ret.update(self.member_shapes)
-        return ret
+        # Read-only; callers must not mutate the returned dict.
+        return self.member_shapes
 
     def satisfies_leaf_condition(self, condition):
-        for _, member_shape in self.member_shapes.items():
-            if not member_shape.satisfies_leaf_condition(condition):
-                return False
-
-        return True
+        cached = self.__leaf_conditions.get(condition)
+        if cached is not None:
+            return cached
+
+        idx = LEAF_CONDITION_STACK.get(id(self))
+        if idx is not None:
+            # Back-edge in a cyclic model: a cycle contributes no leaves of
+            # its own, so answer True (neutral for the enclosing all()).
+            # Frames inside the cycle saw an incomplete picture and must
+            # not cache what they compute; the frame the edge points back
+            # to — and everything above it — holds the whole cycle in its
+            # subtree, so its answer is still sound.
+            for i in range(idx + 1, len(LEAF_CONDITION_TAINT)):
+                LEAF_CONDITION_TAINT[i] = True
+            return True
+
+        LEAF_CONDITION_STACK[id(self)] = len(LEAF_CONDITION_TAINT)
+        LEAF_CONDITION_TAINT.append(False)
+        try:
+            result = all(
+                member_shape.satisfies_leaf_condition(condition)
+                for member_shape in self.member_shapes.values())
+        finally:
+            tainted = LEAF_CONDITION_TAINT.pop()
+            del LEAF_CONDITION_STACK[id(self)]
+
+        if not tainted:
+            self.__leaf_conditions[condition] = result
+        return result
 
     def construct(self, domain):
-        params = {
-            member_name: member_shape.construct(domain)
-            for member_name, member_shape in self.member_shapes.items()
-        }
+        params = dict()
+        for member_name, member_shape in self.member_shapes.items():
+            candidates = member_shape.construct(domain)
+            # One empty candidate list empties the whole product, which is
+            # the common state early on while the domain is still sparse —
+            # bail before building the remaining members' candidates.
+            if isinstance(candidates, list) and not candidates:
+                return iter(())
+            params[member_name] = candidates
 
         return labeled_product(params)
 
@@ -96,6 +169,9 @@ class Structure(Shape):
         """
         # Structures spawn an entity that is themselves,
         ent = super().populate(image, domain, parent)
+        # Walk the members in model order — a key-view intersection would be
+        # a set, and hash-ordered population makes candidate ordering (and
+        # therefore the call sequence) vary run to run.
         for member_name, member_shape in self.member_shapes.items():
             if member_name in image:
                 member_shape.populate(image[member_name], domain, ent)
@@ -103,6 +179,8 @@ class Structure(Shape):
 
 
 class List(Shape):
+    __slots__ = ("member_shape", )
+
     def __init__(self, shape_name, service):
         super().__init__(shape_name, service)
         self.member_shape = service.get_shape(self.shape["member"]["shape"])
@@ -115,16 +193,27 @@ class List(Shape):
         When constructing lists, don't attempt to construct every list, just the longest one.
         """
         # Lists will have one member shape, so get that member shape, convert the results to a list and return that. Don't use the super, since we'll want to construct the lists fresh each time.
-        return apply_ict(self.service.endpoint_prefix(), self.name(), [list(self.member_shape.construct(domain))])
+        members = self.member_shape.construct(domain)
+        # Member shapes frequently hand back a list already (images() does),
+        # so only materialize when we actually got a lazy iterable.
+        if not isinstance(members, list):
+            members = list(members)
+        return apply_ict(self.service.endpoint_prefix(), self.name(),
+                         [members])
 
     def populate(self, image, domain, parent=None):
         ent = super().populate(image, domain, parent)
+        # Bind the member populate once; for long lists the per-element
+        # attribute lookups add up.
+        member_populate = self.member_shape.populate
         for val in image:
-            self.member_shape.populate(val, domain, ent)
+            member_populate(val, domain, ent)
         return ent
 
 
 class Map(Shape):
+    __slots__ = ("key_shape", "val_shape")
+
     def __init__(self, shape_name, service):
         super().__init__(shape_name, service)
         self.key_shape = self.service.get_shape(self.shape["key"]["shape"])
@@ -147,6 +236,9 @@ class Alias(Shape):
 
     Shapes wrapped in an alias will appear in every natural dimension of a domain, as well as the aliased ones.
     """
+
+    __slots__ = ("child_shape", )
+
     def __init__(self, shape_name, service):
         super().__init__(shape_name, service)
         self.child_shape = self.service.get_shape(self.shape["shape"])
@@ -155,11 +247,10 @@ class Alias(Shape):
         return self.child_shape.satisfies_leaf_condition(condition)
 
     def construct(self, domain):
-        s = super().construct(domain)
-        if s != []:
-            return s
-        else:
-            return self.child_shape.construct(domain)
+        # Fall through to the child shape only when the alias's own
+        # dimension has nothing to offer.
+        return super().construct(domain) or self.child_shape.construct(
+            domain)
 
     def populate(self, image, domain, parent=None):
         ent = super().populate(image, domain, parent)
@@ -168,15 +259,15 @@ class Alias(Shape):
 
 
 class LeafShape(Shape):
+    __slots__ = ()
+
     def satisfies_leaf_condition(self, condition):
         return condition(self.shape)
 
     def construct(self, domain):
-        s = super().construct(domain)
-        if s != []:
-            return s
-        else:
-            return []
+        # The domain's images are the only candidates for a plain leaf, so
+        # there's nothing to compare or fall back to.
+        return super().construct(domain)
 
     def populate(self, image, domain, parent=None):
         ent = super().populate(image, domain, parent)
@@ -184,30 +275,32 @@ class LeafShape(Shape):
 
 
 class Blob(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class Boolean(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class Double(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class Float(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class Integer(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class Long(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class String(LeafShape):
+    __slots__ = ("constraints", "pattern")
+
     CONSTRAINTS = ["enum", "max", "min", "pattern"]
 
     def __init__(self, shape_name, service):
@@ -219,14 +312,22 @@ class String(LeafShape):
             for c in self.CONSTRAINTS
         }
 
+        # Compiled form of the pattern constraint, shared across shapes that
+        # declare the same pattern.
+        self.pattern = compile_string_pattern(
+            self.constraints["pattern"]
+        ) if self.constraints["pattern"] is not None else None
+
     def construct(self, domain):
         s = super().construct(domain)
-        if s != []:
+        if s:
             return s
-        elif "enum" in self.constraints:
-            return self.constraints["enum"]
-        else:
-            return []
+        # The enum list when the model declares one, or None when it doesn't.
+        # The None is load-bearing: Request.construct drops None members, so
+        # an unsatisfiable optional string is omitted from the call rather
+        # than emptying the whole product, and a required one trips the
+        # InsufficientMembersException check.
+        return self.constraints["enum"]
 
     def populate(self, image, domain, parent=None):
         # When populating, massage the image into a string via JSON
@@ -235,10 +336,12 @@ class String(LeafShape):
 
 
 class Timestamp(LeafShape):
-    pass
+    __slots__ = ()
 
 
 class EmptyStructure(Structure):
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -256,94 +359,133 @@ class EmptyStructure(Structure):
 
 
 class Request(Structure):
+    __slots__ = ("op", "__members", "__requirements", "required_names")
+
     def __init__(self, shape_name, service, op):
         super().__init__(shape_name, service)
         self.op = op
+        self.__members = None
+        self.__requirements = None
+        # Just the required member names; requirements() also builds the
+        # member shapes, which the satisfaction check doesn't need.
+        self.required_names = frozenset(self.shape.get("required", []))
 
     def requirements(self):
-        return {
-            req: self.service.get_shape(self.shape["members"][req]["shape"])
-            for req in self.shape.get("required", [])
-        }
+        if self.__requirements is None:
+            self.__requirements = {
+                req:
+                self.service.get_shape(self.shape["members"][req]["shape"])
+                for req in self.shape.get("required", [])
+            }
+        return self.__requirements
 
     def members(self):
-        members = super().members()
-        # Request members shouldn't count anything required for pagination
-        return {
-            name: member
-            for name, member in members.items()
-            if name not in self.op.pagination_inputs()
-        }
+        # The pagination-filtered view is stable per op; build it once.
+        if self.__members is None:
+            members = super().members()
+            # Request members shouldn't count anything required for pagination
+            self.__members = {
+                name: member
+                for name, member in members.items()
+                if name not in self.op.pagination_inputs()
+            }
+        return self.__members
 
     def construct(self, domain, included_members=None):
-        if included_members is None:
-            included_members = self.members().values()
-
-        params = {
-            member_name: member.construct(domain)
-            for member_name, member in self.members().items()
-            if member in included_members
-        }
-
-        # Now throw away anything where the value is None
-        params = {k: v for k, v in params.items() if v is not None}
-        if not set(self.requirements().keys()).issubset(set(params.keys())):
+        # Build the params in a single pass: filter to the included members
+        # (all of them by default) and drop anything constructing to None,
+        # instead of building one dict and immediately rebuilding it.
+        params = dict()
+        for member_name, member in self.members().items():
+            if included_members is not None and member not in included_members:
+                continue
+            constructed = member.construct(domain)
+            if constructed is not None:
+                params[member_name] = constructed
+        # dict key views support subset comparison directly, so no fresh
+        # sets are allocated for the check.
+        if not self.required_names <= params.keys():
             raise InsufficientMembersException(
                 "Insufficient members exist for required parameters",
-                self.name(), list(self.requirements().keys()),
-                list(params.keys()))
+                self.name(), list(self.required_names), list(params.keys()))
 
         # When producing our product, if the requirements list is empty then also permit an empty kwargs in the cross-product
         return labeled_product(
-            params, include_empty=(len(self.requirements().keys()) == 0))
+            params, include_empty=(not self.required_names))
 
 
 class Response(Structure):
+    __slots__ = ("op", "__members")
+
     def __init__(self, shape_name, service, op):
         super().__init__(shape_name, service)
         self.op = op
+        self.__members = None
 
     def members(self):
-        members = super().members()
-        # Request members shouldn't count anything required for pagination
-        return {
-            name: member
-            for name, member in members.items()
-            if name not in self.op.pagination_outputs()
-        }
+        if self.__members is None:
+            members = super().members()
+            # Request members shouldn't count anything required for pagination
+            self.__members = {
+                name: member
+                for name, member in members.items()
+                if name not in self.op.pagination_outputs()
+            }
+        return self.__members
 
 
 class Operation(object):
+    __slots__ = ("service", "shape", "paginated", "pag_inputs",
+                 "pag_outputs", "__str", "__hash")
+
     def __init__(self, op, service):
         self.service = service
         self.shape = op
+        # Pagination metadata is static per operation, so compute it lazily
+        # once and reuse; these are hit per construct() call via Request.
+        self.paginated = None
+        self.pag_inputs = None
+        self.pag_outputs = None
+        # Operations are used as set members and dict keys in the main
+        # loops, so precompute the string (interned, as with Shape) and its
+        # hash.
+        self.__str = sys.intern("%s:%s" % (service.endpoint_prefix(),
+                                           op["name"]))
+        self.__hash = hash(self.__str)
 
     def __hash__(self):
-        return hash(self.__str__())
+        return self.__hash
 
     def __eq__(self, other):
         return hash(self) == hash(other)
 
     def is_paginated(self):
-        return self.shape["name"] in self.service.paginators["pagination"]
+        if self.paginated is None:
+            self.paginated = self.shape["name"] in self.service.paginators[
+                "pagination"]
+        return self.paginated
 
     def pagination_inputs(self):
-        if self.is_paginated():
-            return [
-                self.service.paginators["pagination"][self.shape["name"]][k]
-                for k in ["input_token", "limit_key"]
-            ]
-        else:
-            return []
+        if self.pag_inputs is None:
+            if self.is_paginated():
+                self.pag_inputs = [
+                    self.service.paginators["pagination"][self.shape["name"]]
+                    [k] for k in ["input_token", "limit_key"]
+                ]
+            else:
+                self.pag_inputs = []
+        return self.pag_inputs
 
     def pagination_outputs(self):
-        if self.is_paginated():
-            return [
-                self.service.paginators["pagination"][self.shape["name"]][k]
-                for k in ["output_token"]
-            ]
-        else:
-            return []
+        if self.pag_outputs is None:
+            if self.is_paginated():
+                self.pag_outputs = [
+                    self.service.paginators["pagination"][self.shape["name"]]
+                    [k] for k in ["output_token"]
+                ]
+            else:
+                self.pag_outputs = []
+        return self.pag_outputs
 
     def name(self):
         return self.shape["name"]
@@ -372,7 +514,7 @@ class Operation(object):
             return func(**kwargs)
 
     def __str__(self):
-        return "%s:%s" % (self.service_name(), self.name())
+        return self.__str
 
     def __repr__(self):
         return self.__str__()
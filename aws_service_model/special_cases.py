@@ -9,8 +9,9 @@ In many cases, there are specific transformations that need to be performed at d
 """
 
 import json
-from copy import deepcopy
-from .util import Mutator
+from itertools import islice
+
+from .util import Mutator, fast_clone
 
 
 def key_mutate(m, keys, mutator):
@@ -32,39 +33,60 @@ def list_partition(l, k):
     """
     Partition a list into non-overlapping consecutive lists of length k, with a final list of length <k.
     """
-    return [l[i:i + k] for i in range(0, len(l), k)]
+    it = iter(l)
+    return list(iter(lambda: list(islice(it, k)), []))
 
 
 def apply_shape_member_aliasing(service, shape_name, shape):
-    mapping = dict()
-
-    # The mapping we need to use is the union of anything specific to this shape, and the "*" shape mapping.
-    mapping.update(
-        MEMBER_SHAPE_REPLACEMENTS.get(service, dict()).get("*", dict()))
-    mapping.update(
-        MEMBER_SHAPE_REPLACEMENTS.get(service, dict()).get(shape_name, dict()))
-
-    for name, member in shape["members"].items():
-        if name in mapping:
-            member["shape"] = mapping[name]
-
-    return shape
+    # The mapping to use is the union of anything specific to this shape and
+    # the "*" shape mapping, merged once at import time.
+    tables = MERGED_MEMBER_SHAPE_REPLACEMENTS.get(service)
+    if tables is None:
+        return shape
+    mapping = tables.get(shape_name, tables["*"])
+
+    if not mapping or not shape["members"]:
+        return shape
+
+    # Rebuild the aliased members rather than mutating in place, since the
+    # shape handed in may be the raw (shared) service model dict.
+    ret = dict(shape)
+    ret["members"] = {
+        name: dict(member, shape=mapping[name]) if name in mapping else member
+        for name, member in shape["members"].items()
+    }
+    return ret
 
 
 def apply_transform(transform, service, shape_name, value):
     m = transform.get(service, dict()).get(shape_name, None)
-    if m is not None:
-        return m.apply(deepcopy(value))
-    else:
-        return deepcopy(value)
+    if m is None:
+        # No transform means no mutation; hand the value back untouched
+        # rather than paying for a clone nobody will write to.
+        return value
+    # Mutator.apply clones for itself unless the mutator is pure, so passing
+    # a pre-made clone here would just be copying twice.
+    return m.apply(value)
+
+
+# The transform tables are module-level constants and the raw shapes never
+# change after the service model is loaded, so the transformed result for a
+# given (service, shape_name) can be computed once and reused.
+__SHAPE_CONSTRUCTION_CACHE = dict()
 
 
 def apply_shape_construction_transform(service, shape_name, shape):
+    key = (service, shape_name)
+    if key in __SHAPE_CONSTRUCTION_CACHE:
+        return __SHAPE_CONSTRUCTION_CACHE[key]
+
     ret = apply_transform(SHAPE_CONSTRUCTION_TRANSFORMS, service, shape_name,
                           shape)
     if shape["type"] == "structure":
         # Now apply any shape member transformations described.
         ret = apply_shape_member_aliasing(service, shape_name, ret)
+
+    __SHAPE_CONSTRUCTION_CACHE[key] = ret
     return ret
 
 
@@ -86,13 +108,18 @@ def get_shape_alias(service, shape_name):
     return ret
 
 
+# Hoisted to module level so membership tests are O(1) set lookups instead
+# of rebuilding a list per element as the blacklists grow.
+IAM_OPERATION_WHITELIST = frozenset({"GetAccountAuthorizationDetails"})
+APIGATEWAY_OPERATION_BLACKLIST = frozenset({"GetExport"})
+
 OPERATION_BLACKLIST = {
     "iam": Mutator([
-        lambda ops: [op for op in ops if op.name() in ["GetAccountAuthorizationDetails"]]
-    ]),
+        lambda ops: [op for op in ops if op.name() in IAM_OPERATION_WHITELIST]
+    ], pure=True),
     "apigateway": Mutator([
-        lambda ops: [op for op in ops if op.name() not in ["GetExport"]]
-    ]),
+        lambda ops: [op for op in ops if op.name() not in APIGATEWAY_OPERATION_BLACKLIST]
+    ], pure=True),
 }
 
 # For aliasing a shape name to something other than teh default of type=string
@@ -135,6 +162,26 @@ MEMBER_SHAPE_REPLACEMENTS = {
     }
 }
 
+def __build_merged_member_replacements():
+    """
+    Flatten MEMBER_SHAPE_REPLACEMENTS into per-service tables where each shape name maps to its "*"-merged mapping, so apply_shape_member_aliasing does a single lookup per call instead of two get chains and two updates.
+    """
+    merged = dict()
+    for service, tables in MEMBER_SHAPE_REPLACEMENTS.items():
+        star = tables.get("*", dict())
+        service_merged = {"*": star}
+        for shape_name, table in tables.items():
+            if shape_name == "*":
+                continue
+            combined = dict(star)
+            combined.update(table)
+            service_merged[shape_name] = combined
+        merged[service] = service_merged
+    return merged
+
+
+MERGED_MEMBER_SHAPE_REPLACEMENTS = __build_merged_member_replacements()
+
 # When constructing images, there are certain transforms that will be required. Such as ensuring that
 # a list returned from one method is broken into lists an appropriate length for use as the inputs
 # of another API method.
@@ -144,7 +191,7 @@ IMAGE_CONSTRUCTION_TRANSFORMS = {
         Mutator([
             # The list should be in groups of at most 10 items, this is enforced by the API.
             lambda val: list_partition(val[0], 10)
-        ])
+        ], pure=True)
     }
 }
 
@@ -157,10 +204,21 @@ ENTITY_MANIFESTATION_TRANSFORMS = {
         Mutator([
             # The policies provided are actually a dictionary, not a JSON string as described in the model.
             lambda v: json.dumps(v)
-        ])
+        ], pure=True)
     }
 }
 
+# Allow/block lists for the transforms below, hoisted to frozensets so the
+# per-element membership tests are O(1) instead of scanning a list literal
+# rebuilt inside the lambda.
+ACM_EKU_BLACKLIST = frozenset({"CUSTOM"})
+IAM_LIST_POLICIES_MEMBERS = frozenset(
+    {"Scope", "OnlyAttached", "PathPrefix", "Marker", "MaxItems"})
+IAM_LIST_ENTITIES_FOR_POLICY_MEMBERS = frozenset(
+    {"PolicyArn", "EntityFilter", "PathPrefix", "Marker", "MaxItems"})
+IAM_POLICY_SCOPE_BLACKLIST = frozenset({"All", "AWS"})
+IAM_ENTITY_TYPE_BLACKLIST = frozenset({"AWSManagedPolicy"})
+
 SHAPE_CONSTRUCTION_TRANSFORMS = {
     "acm": {
         "ExtendedKeyUsageName": Mutator([
@@ -168,7 +226,7 @@ SHAPE_CONSTRUCTION_TRANSFORMS = {
             lambda shape: key_mutate(
                 shape,
                 "enum",
-                lambda enums: [e for e in enums if e != "CUSTOM"]
+                lambda enums: [e for e in enums if e not in ACM_EKU_BLACKLIST]
             )
         ])
     },
@@ -180,10 +238,7 @@ SHAPE_CONSTRUCTION_TRANSFORMS = {
                 "members",
                 lambda members: {
                     k: v for k, v in members.items() if
-                    k in [
-                        "Scope", "OnlyAttached", "PathPrefix",
-                        "Marker", "MaxItems"
-                    ]
+                    k in IAM_LIST_POLICIES_MEMBERS
                 }
             )
         ]),
@@ -193,10 +248,7 @@ SHAPE_CONSTRUCTION_TRANSFORMS = {
                 "members",
                 lambda members: {
                     k: v for k, v in members.items() if
-                    k in [
-                        "PolicyArn", "EntityFilter", "PathPrefix",
-                        "Marker", "MaxItems"
-                    ]
+                    k in IAM_LIST_ENTITIES_FOR_POLICY_MEMBERS
                 }
             )
         ]),
@@ -205,7 +257,9 @@ SHAPE_CONSTRUCTION_TRANSFORMS = {
             lambda shape: key_mutate(
                 shape,
                 "enum",
-                lambda enums: [e for e in enums if e not in ["All", "AWS"]]
+                lambda enums: [
+                    e for e in enums if e not in IAM_POLICY_SCOPE_BLACKLIST
+                ]
             )
         ]),
         "EntityType": Mutator([
@@ -213,7 +267,9 @@ SHAPE_CONSTRUCTION_TRANSFORMS = {
             lambda shape: key_mutate(
                 shape,
                 "enum",
-                lambda enums: [e for e in enums if e not in ["AWSManagedPolicy"]]
+                lambda enums: [
+                    e for e in enums if e not in IAM_ENTITY_TYPE_BLACKLIST
+                ]
             )
         ]),
     }
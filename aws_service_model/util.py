@@ -1,14 +1,25 @@
 import itertools
-from copy import deepcopy
 import json
 
 
+def fast_clone(val):
+    """
+    Clone a structure of plain dicts, lists, and scalars without deepcopy's per-node memo bookkeeping and type dispatch. Values of any other type are returned as-is (shared, not copied).
+    """
+    if isinstance(val, dict):
+        return {k: fast_clone(v) for k, v in val.items()}
+    elif isinstance(val, list):
+        return [fast_clone(v) for v in val]
+    else:
+        return val
+
+
 class JSONStringEncoder(json.JSONEncoder):
     def default(self, obj):  # pylint: disable=E0202
-        try:
-            return json.JSONEncoder.default(self, obj)
-        except TypeError:
-            return str(obj)
+        # default() is only ever called for objects the base encoder can't
+        # handle, and the base implementation unconditionally raises
+        # TypeError — so the raise/catch dance was pure overhead.
+        return str(obj)
 
 
 def json_repr_dump(obj):
@@ -16,11 +27,24 @@ def json_repr_dump(obj):
 
 
 class All(object):
+    """
+    Wildcard sentinel. A singleton compared by identity, so it can sit in dicts and sets without matching (or colliding with) unrelated keys the way an unconditional __eq__ did.
+    """
+
+    __slots__ = ()
+
+    __instance = None
+
+    def __new__(cls):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+        return cls.__instance
+
     def __eq__(self, other):
-        return True
+        return other is self
 
     def __hash__(self):
-        return hash("hashyhashhash")
+        return id(type(self))
 
     def __str__(self):
         return "All"
@@ -30,14 +54,17 @@ class All(object):
 
 
 class Mutator(object):
-    def __init__(self, lambdas):
+    __slots__ = ("lambdas", "pure")
+
+    def __init__(self, lambdas, pure=False):
+        """
+        A pure Mutator promises that its lambdas never modify their input (they build and return fresh objects), which lets apply() skip the defensive clone of the value.
+        """
         self.lambdas = lambdas
+        self.pure = pure
 
     def apply(self, val):
-        try:
-            ret = deepcopy(val)
-        except TypeError:
-            ret = val
+        ret = val if self.pure else fast_clone(val)
 
         for l in self.lambdas:
             ret = l(ret)
@@ -48,17 +75,18 @@ def labeled_product(iterables, include_empty=False):
     """
     Return a product, maintaining the labeling of keys mapping to the input iterables.
     """
-    keys = list(iterables.keys())
-    values = [iterables[k] for k in keys]
-    for p in itertools.product(*values):
+    # Dicts iterate keys and values in the same order, so don't re-index.
+    keys = tuple(iterables)
+    for p in itertools.product(*iterables.values()):
         yield dict(zip(keys, p))
-    if include_empty and len(values) == 0:
+    if include_empty and not keys:
         yield dict()
 
 
 def careful_dict_update(first, second):
     for k, v in second.items():
-        if k in first and isinstance(first[k], list) and isinstance(v, list):
-            first[k] += v
+        prev = first.get(k)
+        if type(prev) is list and type(v) is list:
+            prev.extend(v)
         else:
             first[k] = v
@@ -7,18 +7,19 @@ import sys
 from aws_service_model.service import AWSService
 from aws_service_model.domain import Domain
 from aws_service_model.exceptions import InsufficientMembersException
+from aws_service_model.shapes import Alias
 from aws_service_model.util import json_repr_dump
 
+# str.startswith accepts a tuple and short-circuits in C, which beats both
+# chained startswith calls and the regex engine for fixed prefixes.
+READ_ONLY_OP_PREFIXES = ("List", "Describe", "Get")
+
 
 def read_only_op_filter(op):
     """
     Filter operations to only those that start with List, Describe, or Get
     """
-    if op.name().startswith("List") or op.name().startswith(
-            "Describe") or op.name().startswith("Get"):
-        return True
-    else:
-        return False
+    return op.name().startswith(READ_ONLY_OP_PREFIXES)
 
 
 if __name__ == "__main__":
@@ -31,11 +32,17 @@ if __name__ == "__main__":
 
     operations = service.get_operations()
 
-    # Look for all read-only operations
-    read_only_operations = [op for op in operations if read_only_op_filter(op)]
-
-    # Look for any operations where the requirements list is empty
-    starter_ops = [op for op in read_only_operations if op.input().requirements() == dict()]
+    # Classify the operations in a single pass: read-only ops go into an
+    # insertion-ordered dict (ordering from get_operations(), O(1) removal),
+    # and those with no required inputs are the starters.
+    read_only_operations = dict()
+    starter_ops = []
+    for op in operations:
+        if not read_only_op_filter(op):
+            continue
+        read_only_operations[op] = None
+        if op.input().requirements() == dict():
+            starter_ops.append(op)
 
     # Define the domain of known entities, initialized to empty.
     𝕌 = Domain()
@@ -44,8 +51,11 @@ if __name__ == "__main__":
 
     # For each starter operation, these are handled separately, since it's a little more efficient especially for large numbers of operations.
     for op in starter_ops:
-        # Call the operation over all constructed inputs
+        # Call the operation over all constructed inputs. Bind the input and
+        # output shapes once per op; they're rebuilt on every input()/output()
+        # call otherwise.
         input_shape = op.input()
+        output_shape = op.output()
         print(op, input_shape, file=sys.stderr)
         success = False
         for params in input_shape.construct(𝔻):
@@ -53,37 +63,62 @@ if __name__ == "__main__":
             resp = op.call(params)
             # Pass the response and the universe to the output shape to populate the universe with entities we can derive from this response.
             if resp is not None:
-                op.output().populate(resp, 𝔻)
+                output_shape.populate(resp, 𝔻)
                 success = True
 
         # Remove the starter ops that succeeded from the ops we'll try later.
         if success:
-            read_only_operations.remove(op)
+            del read_only_operations[op]
+
+    def requirement_dimensions(shape):
+        """
+        The dimensions an operation requirement draws candidate values from: the requirement shape's own dimension, plus the chain of child dimensions if the shape is an alias (since aliases fall through to their child when their own dimension is empty).
+        """
+        dims = [𝔻.dimension(shape.name())]
+        while isinstance(shape, Alias):
+            shape = shape.child_shape
+            dims.append(𝔻.dimension(shape.name()))
+        return dims
+
+    # Versions of the requirement dimensions as of each op's last failure.
+    # An op whose requirements raised InsufficientMembersException will keep
+    # failing until one of those dimensions grows, so don't re-attempt it
+    # until one does.
+    failed_at = dict()
 
     # Now, for every other operation, try to construct enough to satisfy the requirements for each.
-    while read_only_operations != []:
+    while read_only_operations:
         successes = set()
-        for rop in read_only_operations:
+        for rop in list(read_only_operations):
+            input_shape = rop.input()
+            versions = [
+                dim.version()
+                for req_shape in input_shape.requirements().values()
+                for dim in requirement_dimensions(req_shape)
+            ]
+            if rop in failed_at and failed_at[rop] == versions:
+                continue
             try:
-                input_shape = rop.input()
+                output_shape = rop.output()
                 population = input_shape.construct(𝔻)
                 # If successful, do the same thing: call, populate entities.
                 for params in population:
                     print(rop, input_shape, params, file=sys.stderr)
                     resp = rop.call(params)
                     if resp is not None:
-                        rop.output().populate(resp, 𝔻)
+                        output_shape.populate(resp, 𝔻)
                         # If we successfully did something with this, then count that as a success.
                         successes.add(rop)
             except InsufficientMembersException as e:
+                failed_at[rop] = versions
                 print(e, file=sys.stderr)
 
-        # For any operation that succeeded, remove it from the list and try the rest again.
+        # For any operation that succeeded, remove it and try the rest again.
         for op in successes:
-            read_only_operations.remove(op)
+            read_only_operations.pop(op, None)
 
         # If nothing succeeded this round, then nothing will succeed next round either, so quit.
-        if successes == set():
+        if not successes:
             break
         print("=====")
 